@@ -39,6 +39,29 @@ N = 0xFFFFFFFFFFFFFFFEFFFFB5AE3C523E63944F2127
 GX = 0x128EC4256487FD8FDF64E2437BC0A1F6D5AFDE2C
 GY = 0x5958557EB1DB001260425524DBC379D5AC5F4ADF
 
+# La courbe VSH a A = P - 3, c'est-à-dire a ≡ -3 (mod p), comme les
+# courbes NIST. Plusieurs formules ci-dessous exploitent ce cas
+# particulier (3x² + a = 3(x-1)(x+1), doublement jacobien raccourci) :
+# on le verrouille ici pour que toute modification des paramètres
+# casse bruyamment plutôt que de donner des points faux.
+assert A == P - 3
+
+
+# ============================================================================
+# ACCÉLÉRATION OPTIONNELLE : gmpy2
+# ============================================================================
+#
+# Si gmpy2 est installé (pip install gmpy2), ses entiers mpz (bindings
+# GMP en C) remplacent les int Python dans les boucles internes des
+# multiplications scalaires : mêmes résultats, arithmétique 3 à 5 fois
+# plus rapide sur des entiers de 160 bits. Sans gmpy2, on retombe
+# silencieusement sur les int natifs — aucune dépendance obligatoire.
+
+try:
+    from gmpy2 import mpz as _mpz
+except ImportError:
+    _mpz = int
+
 
 # ============================================================================
 # ARITHMÉTIQUE MODULAIRE
@@ -50,9 +73,13 @@ def mod_inverse(a: int, m: int) -> int:
     
     L'inverse de a modulo m est l'entier x tel que :
         a * x ≡ 1  (mod m)
-    
-    Utilise l'algorithme d'Euclide étendu.
-    
+
+    Utilise le builtin pow(a, -1, m) (Python ≥ 3.8), qui calcule
+    l'inverse directement en C — bien plus rapide que l'algorithme
+    d'Euclide étendu écrit en Python. Cette version générique
+    fonctionne pour un module m quelconque ; pour les modules fixes de
+    la courbe, mod_inverse_p / mod_inverse_n existent aussi.
+
     Args:
         a: L'entier dont on cherche l'inverse
         m: Le module
@@ -69,38 +96,152 @@ def mod_inverse(a: int, m: int) -> int:
         >>> (3 * 5) % 7
         1
     """
-    if a < 0:
-        a = a % m
-    
-    g, x, _ = _extended_gcd(a, m)
-    
-    if g != 1:
+    try:
+        return pow(a % m, -1, m)
+    except ValueError:
         raise ValueError(f"Pas d'inverse modulaire pour {a} modulo {m}")
-    
-    return x % m
 
 
-def _extended_gcd(a: int, b: int) -> tuple:
+def mod_inverse_p(a: int) -> int:
     """
-    Algorithme d'Euclide étendu.
-    
-    Calcule le PGCD de a et b, ainsi que les coefficients de Bézout
-    x et y tels que : a*x + b*y = pgcd(a, b)
-    
+    Inverse modulaire modulo P (le module premier de la courbe).
+
+    Comme P est premier, le petit théorème de Fermat donne :
+        a^(P-1) ≡ 1  (mod P)   donc   a^(-1) ≡ a^(P-2)  (mod P)
+
+    Le calcul se fait via le builtin pow(a, P-2, P), implémenté en C
+    par CPython : beaucoup plus rapide que l'algorithme d'Euclide
+    étendu écrit en Python, et sans récursion.
+
     Args:
-        a, b: Les deux entiers
-    
+        a: L'entier à inverser (non divisible par P)
+
     Returns:
-        (pgcd, x, y) : le PGCD et les coefficients de Bézout
+        L'inverse de a modulo P
     """
-    if a == 0:
-        return b, 0, 1
-    
-    gcd, x1, y1 = _extended_gcd(b % a, a)
-    x = y1 - (b // a) * x1
-    y = x1
-    
-    return gcd, x, y
+    return pow(a, P - 2, P)
+
+
+def mod_inverse_n(a: int) -> int:
+    """
+    Inverse modulaire modulo N (l'ordre du groupe).
+
+    Même principe que mod_inverse_p : N est premier, donc
+    a^(-1) ≡ a^(N-2) (mod N) par le petit théorème de Fermat.
+
+    Args:
+        a: L'entier à inverser (non divisible par N)
+
+    Returns:
+        L'inverse de a modulo N
+    """
+    return pow(a, N - 2, N)
+
+
+def sqrt_mod_p(a: int) -> int:
+    """
+    Racine carrée modulaire modulo P.
+
+    Notre module vérifie P ≡ 3 (mod 4) : si a est un carré modulo P,
+    alors a^((P+1)/4) en est une racine (l'autre étant son opposé).
+
+    Sert à "relever" une coordonnée x en un point de la courbe, par
+    exemple pour reconstruire le point R d'une signature à partir du
+    seul r (vérification par lots).
+
+    Args:
+        a: Le carré supposé
+
+    Returns:
+        Une racine carrée de a modulo P
+
+    Raises:
+        ValueError: Si a n'est pas un carré modulo P
+    """
+    root = pow(a % P, (P + 1) // 4, P)
+
+    if (root * root) % P != a % P:
+        raise ValueError(f"{a} n'est pas un carré modulo P")
+
+    return root
+
+
+# P ≡ 3 (mod 4) est requis par la formule de sqrt_mod_p ci-dessus
+assert P % 4 == 3
+
+
+# ============================================================================
+# ARITHMÉTIQUE DE MONTGOMERY (référence)
+# ============================================================================
+#
+# La réduction de Montgomery remplace chaque division « % P » par des
+# décalages et une multiplication par la constante précalculée
+# _P_INV_NEG. Un nombre a est représenté par â = a·R mod P avec
+# R = 2^160 ; le produit de deux représentants se réduit via REDC sans
+# aucune division par P.
+#
+# NOTE PERFORMANCE : sous CPython, l'opérateur % sur les grands entiers
+# est déjà du C optimisé, et une réduction REDC écrite en Python est
+# PLUS LENTE. Ces primitives sont donc fournies comme référence (et
+# comme base pour un éventuel portage C/GMP, où elles gagnent 2 à 3×),
+# mais les formules jacobiennes ci-dessous conservent le % natif.
+
+# R = 2^160 (juste au-dessus de P, puissance de 2 pour des décalages)
+_R_BITS = 160
+_R = 1 << _R_BITS
+_R_MASK = _R - 1
+
+# R² mod P : sert à entrer dans le domaine de Montgomery
+_R2 = (_R * _R) % P
+
+# -P⁻¹ mod R : la constante centrale de la réduction REDC
+_P_INV_NEG = (-pow(P, -1, _R)) % _R
+
+
+def _mont_redc(t: int) -> int:
+    """
+    Réduction de Montgomery : calcule t · R⁻¹ mod P sans division.
+
+    Algorithme REDC :
+        m = (t mod R) · (-P⁻¹)  mod R
+        u = (t + m·P) / R        (division exacte : simple décalage)
+        si u ≥ P : u -= P
+
+    Args:
+        t: Entier à réduire, 0 ≤ t < R·P
+
+    Returns:
+        t · R⁻¹ mod P
+    """
+    m = ((t & _R_MASK) * _P_INV_NEG) & _R_MASK
+    u = (t + m * P) >> _R_BITS
+    return u - P if u >= P else u
+
+
+def to_mont(a: int) -> int:
+    """
+    Entre dans le domaine de Montgomery : renvoie â = a·R mod P.
+
+    Exemple:
+        >>> from_mont(to_mont(42))
+        42
+    """
+    return _mont_redc((a % P) * _R2)
+
+
+def from_mont(a_hat: int) -> int:
+    """Sort du domaine de Montgomery : renvoie a = â·R⁻¹ mod P."""
+    return _mont_redc(a_hat)
+
+
+def mont_mul(a_hat: int, b_hat: int) -> int:
+    """
+    Multiplication dans le domaine de Montgomery.
+
+    Pour â = a·R et b̂ = b·R, renvoie (a·b)·R mod P — c'est-à-dire le
+    représentant de Montgomery du produit, sans aucun « % P ».
+    """
+    return _mont_redc(a_hat * b_hat)
 
 
 # ============================================================================
@@ -127,7 +268,12 @@ class Point:
         >>> O.is_infinity()
         True
     """
-    
+
+    # Pas de __dict__ par instance : les multiplications scalaires
+    # créent des centaines de Points transitoires, __slots__ réduit
+    # leur empreinte mémoire et accélère l'accès à .x / .y
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int = None, y: int = None):
         """
         Crée un nouveau point.
@@ -163,10 +309,16 @@ class Point:
         """
         if self.is_infinity():
             return True
-        
+
         left = (self.y * self.y) % P
-        right = (self.x**3 + A * self.x + B) % P
-        
+
+        # x³ est calculé via x² réduit d'abord : les intermédiaires
+        # restent bornés à ~320 bits (au lieu de ~480 pour x**3 brut).
+        # A·x devient -3·x grâce à A = P - 3 : on économise une
+        # multiplication de deux entiers de 160 bits.
+        xx = (self.x * self.x) % P
+        right = (xx * self.x - 3 * self.x + B) % P
+
         return left == right
     
     def __eq__(self, other) -> bool:
@@ -239,11 +391,13 @@ def point_add(P1: Point, P2: Point) -> Point:
         >>> point_add(G, O) == G
         True
     """
-    # Cas 1 : Un des points est le point à l'infini
+    # Cas 1 : Un des points est le point à l'infini.
+    # Les Points ne sont jamais modifiés après création : on peut
+    # renvoyer l'opérande lui-même plutôt qu'une copie.
     if P1.is_infinity():
-        return Point(P2.x, P2.y)
+        return P2
     if P2.is_infinity():
-        return Point(P1.x, P1.y)
+        return P1
     
     # Cas 2 : P1 = -P2 (même x, y opposés)
     if P1.x == P2.x and P1.y != P2.y:
@@ -252,8 +406,9 @@ def point_add(P1: Point, P2: Point) -> Point:
     # Cas 3 et 4 : Calcul de la pente λ (lambda)
     if P1.x == P2.x and P1.y == P2.y:
         # Cas 4 : Doublement (P1 = P2)
-        # λ = (3x² + a) / (2y)
-        numerator = (3 * P1.x * P1.x + A) % P
+        # λ = (3x² + a) / (2y), avec a = -3 :
+        # 3x² - 3 = 3(x - 1)(x + 1) — une multiplication de moins
+        numerator = (3 * (P1.x - 1) * (P1.x + 1)) % P
         denominator = (2 * P1.y) % P
     else:
         # Cas 3 : Addition de points distincts
@@ -262,7 +417,7 @@ def point_add(P1: Point, P2: Point) -> Point:
         denominator = (P2.x - P1.x) % P
     
     # Division modulaire : λ = numerator * denominator^(-1)
-    lam = (numerator * mod_inverse(denominator, P)) % P
+    lam = (numerator * mod_inverse_p(denominator)) % P
     
     # Calcul des coordonnées du résultat
     x3 = (lam * lam - P1.x - P2.x) % P
@@ -271,38 +426,303 @@ def point_add(P1: Point, P2: Point) -> Point:
     return Point(x3, y3)
 
 
-def point_multiply(k: int, P: Point) -> Point:
+# ----------------------------------------------------------------------------
+# Coordonnées jacobiennes (usage interne)
+# ----------------------------------------------------------------------------
+#
+# En coordonnées affines, chaque addition de points coûte une inversion
+# modulaire (la division par le dénominateur de la pente λ), soit ~240
+# inversions par multiplication scalaire de 160 bits.
+#
+# Les coordonnées jacobiennes (X, Y, Z) représentent le point affine
+#     x = X / Z²,  y = Y / Z³
+# et permettent d'additionner et de doubler SANS aucune inversion
+# (une dizaine de multiplications à la place). On ne paie plus qu'une
+# seule inversion, tout à la fin, pour revenir en affine.
+#
+# Le point à l'infini est représenté par Z = 0.
+
+def _jac_double(X: int, Y: int, Z: int) -> tuple:
+    """
+    Doublement d'un point en coordonnées jacobiennes.
+
+    Utilise la formule spécialisée pour a = -3 (notre courbe a bien
+    A = P - 3, comme la plupart des courbes NIST) :
+
+        δ = Z²,  γ = Y²,  β = X·γ
+        α = 3(X - δ)(X + δ)
+        X' = α² - 8β
+        Z' = (Y + Z)² - γ - δ
+        Y' = α(4β - X') - 8γ²
+
+    Args:
+        X, Y, Z: Coordonnées jacobiennes du point
+
+    Returns:
+        Les coordonnées jacobiennes (X', Y', Z') de 2·(X, Y, Z)
+    """
+    if Z == 0 or Y == 0:
+        return (1, 1, 0)  # 2·O = O, et 2·(x, 0) = O
+
+    delta = (Z * Z) % P
+    gamma = (Y * Y) % P
+    beta = (X * gamma) % P
+    alpha = (3 * (X - delta) * (X + delta)) % P
+
+    X3 = (alpha * alpha - 8 * beta) % P
+    Z3 = ((Y + Z) * (Y + Z) - gamma - delta) % P
+    Y3 = (alpha * (4 * beta - X3) - 8 * gamma * gamma) % P
+
+    return (X3, Y3, Z3)
+
+
+def _jac_add_affine(X1: int, Y1: int, Z1: int, x2: int, y2: int) -> tuple:
+    """
+    Addition mixte : point jacobien (X1, Y1, Z1) + point affine (x2, y2).
+
+    L'addition "mixte" exploite le fait que le second opérande a Z = 1
+    (il vient de la table de précalcul, stockée en affine), ce qui
+    économise plusieurs multiplications par rapport à l'addition
+    jacobienne générale.
+
+    Args:
+        X1, Y1, Z1: Coordonnées jacobiennes du premier point
+        x2, y2: Coordonnées affines du second point
+
+    Returns:
+        Les coordonnées jacobiennes de la somme
+    """
+    if Z1 == 0:
+        return (x2, y2, 1)  # O + P2 = P2
+
+    Z1Z1 = (Z1 * Z1) % P
+    U2 = (x2 * Z1Z1) % P
+    S2 = (y2 * Z1 * Z1Z1) % P
+    H = (U2 - X1) % P
+    r = (S2 - Y1) % P
+
+    if H == 0:
+        if r == 0:
+            return _jac_double(X1, Y1, Z1)  # P1 = P2 : doublement
+        return (1, 1, 0)  # P1 = -P2 : point à l'infini
+
+    HH = (H * H) % P
+    HHH = (H * HH) % P
+    V = (X1 * HH) % P
+
+    X3 = (r * r - HHH - 2 * V) % P
+    Y3 = (r * (V - X3) - Y1 * HHH) % P
+    Z3 = (Z1 * H) % P
+
+    return (X3, Y3, Z3)
+
+
+def _jac_add(X1: int, Y1: int, Z1: int, X2: int, Y2: int, Z2: int) -> tuple:
+    """
+    Addition jacobienne générale : (X1, Y1, Z1) + (X2, Y2, Z2).
+
+    Contrairement à _jac_add_affine, aucun des deux opérandes n'a
+    besoin d'être en affine — nécessaire pour l'échelle de Montgomery
+    (point_multiply_ct), où les deux registres évoluent en jacobien.
+
+    Args:
+        X1, Y1, Z1: Coordonnées jacobiennes du premier point
+        X2, Y2, Z2: Coordonnées jacobiennes du second point
+
+    Returns:
+        Les coordonnées jacobiennes de la somme
+    """
+    if Z1 == 0:
+        return (X2, Y2, Z2)
+    if Z2 == 0:
+        return (X1, Y1, Z1)
+
+    Z1Z1 = (Z1 * Z1) % P
+    Z2Z2 = (Z2 * Z2) % P
+    U1 = (X1 * Z2Z2) % P
+    U2 = (X2 * Z1Z1) % P
+    S1 = (Y1 * Z2 * Z2Z2) % P
+    S2 = (Y2 * Z1 * Z1Z1) % P
+    H = (U2 - U1) % P
+    r = (S2 - S1) % P
+
+    if H == 0:
+        if r == 0:
+            return _jac_double(X1, Y1, Z1)  # P1 = P2 : doublement
+        return (1, 1, 0)  # P1 = -P2 : point à l'infini
+
+    HH = (H * H) % P
+    HHH = (H * HH) % P
+    V = (U1 * HH) % P
+
+    X3 = (r * r - HHH - 2 * V) % P
+    Y3 = (r * (V - X3) - S1 * HHH) % P
+    Z3 = (Z1 * Z2 * H) % P
+
+    return (X3, Y3, Z3)
+
+
+def _jac_to_affine(X: int, Y: int, Z: int) -> Point:
+    """
+    Convertit un point jacobien en point affine.
+
+    C'est ici, et seulement ici, que l'on paie l'inversion modulaire :
+        x = X / Z²,  y = Y / Z³
+
+    Args:
+        X, Y, Z: Coordonnées jacobiennes du point
+
+    Returns:
+        Le Point affine correspondant (ou le point à l'infini si Z = 0)
+    """
+    if Z == 0:
+        return Point()
+
+    z_inv = mod_inverse_p(Z)
+    z_inv2 = (z_inv * z_inv) % P
+
+    # int(...) : revient aux int natifs si la boucle a travaillé en mpz
+    return Point(int((X * z_inv2) % P), int((Y * z_inv2 * z_inv) % P))
+
+
+# Cache des tables de multiples impairs, par point de base.
+#
+# verify_signature est appelée en boucle avec la MÊME clé publique
+# Sony : inutile de recalculer P, 3P, 5P, 7P à chaque fois. La clé du
+# cache est (x, y) ; la taille est bornée pour ne pas accumuler des
+# tables de points éphémères (on évince alors la plus ancienne).
+_TABLE_CACHE = {}
+_TABLE_CACHE_MAX = 8
+
+
+def _wnaf_table(pt: Point, cache: bool = True) -> dict:
+    """
+    Table des multiples impairs ±1P, ±3P, ±5P, ±7P d'un point.
+
+    Le résultat (coordonnées affines, prêtes pour l'addition mixte)
+    est mémorisé dans _TABLE_CACHE : les appels suivants avec le même
+    point — typiquement la clé publique lors de vérifications
+    répétées — le récupèrent sans aucun calcul.
+
+    Args:
+        pt: Le point de base (différent du point à l'infini)
+        cache: False pour un point éphémère (utilisé une seule fois) :
+            sa table n'est alors pas mémorisée, ce qui évite d'évincer
+            du cache celles des points durables comme G ou la clé
+            publique
+
+    Returns:
+        Dictionnaire d -> (x, y) pour d dans {±1, ±3, ±5, ±7}
+    """
+    key = (pt.x, pt.y)
+    if cache:
+        table = _TABLE_CACHE.get(key)
+        if table is not None:
+            return table
+
+    odd = {1: pt}
+    double = point_add(pt, pt)
+    for d in (3, 5, 7):
+        odd[d] = point_add(odd[d - 2], double)
+
+    table = {}
+    for d in (1, 3, 5, 7):
+        neg = point_negate(odd[d])
+        table[d] = (_mpz(odd[d].x), _mpz(odd[d].y))
+        table[-d] = (_mpz(neg.x), _mpz(neg.y))
+
+    if cache:
+        if len(_TABLE_CACHE) >= _TABLE_CACHE_MAX:
+            _TABLE_CACHE.pop(next(iter(_TABLE_CACHE)))
+        _TABLE_CACHE[key] = table
+
+    return table
+
+
+def _naf(k: int, w: int = 4) -> list:
+    """
+    Décompose un scalaire en forme NAF fenêtrée (width-w Non-Adjacent Form).
+
+    Chaque chiffre est soit 0, soit un entier IMPAIR dans
+    ]-2^(w-1), 2^(w-1)[. En moyenne, seul 1 chiffre sur (w+1) est
+    non nul, contre 1 bit sur 2 pour l'écriture binaire classique :
+    on divise donc par deux le nombre d'additions de points
+    nécessaires dans la multiplication scalaire.
+
+    Algorithme (Hankerson et al., alg. 3.35) :
+        Tant que k > 0 :
+            - Si k est impair : extraire d = k mod 2^w comme valeur
+              signée dans ]-2^(w-1), 2^(w-1)], puis k = k - d
+            - Sinon : d = 0
+            - Émettre d, puis k = k >> 1
+
+    Args:
+        k: Le scalaire (entier positif)
+        w: La largeur de fenêtre (4 par défaut)
+
+    Returns:
+        La liste des chiffres signés, poids faible en premier
+
+    Exemple:
+        >>> _naf(13)    # 13 = 16 - 3
+        [-3, 0, 0, 0, 1]
+    """
+    digits = []
+    half = 1 << (w - 1)
+    full = 1 << w
+
+    while k > 0:
+        if k & 1:
+            d = k % full
+            if d >= half:
+                d -= full
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+
+    return digits
+
+
+def point_multiply(k: int, P1: Point, cache: bool = True) -> Point:
     """
     Multiplication scalaire : calcule k * P.
-    
+
     La multiplication scalaire consiste à additionner un point P
     à lui-même k fois :
         k * P = P + P + ... + P  (k fois)
-    
-    Utilise l'algorithme "double-and-add" (similaire à l'exponentiation
-    rapide) pour calculer efficacement en O(log k) opérations.
-    
-    Algorithme double-and-add :
-        1. Écrire k en binaire : k = k_n k_{n-1} ... k_1 k_0
-        2. Initialiser result = O (point à l'infini)
-        3. Pour chaque bit de k (du plus significatif au moins significatif) :
+
+    Utilise l'algorithme "NAF fenêtré" (fenêtre w = 4), une variante
+    du classique "double-and-add" qui réduit le nombre d'additions :
+
+        1. Précalculer les multiples impairs P, 3P, 5P, 7P
+           (et leurs opposés, gratuits sur une courbe elliptique)
+        2. Écrire k en forme NAF fenêtrée (chiffres signés, voir _naf)
+        3. Initialiser result = O (point à l'infini)
+        4. Pour chaque chiffre d (du plus significatif au moins
+           significatif) :
            - result = 2 * result  (doublement)
-           - Si le bit vaut 1 : result = result + P
-        4. Retourner result
-    
-    Exemple : 13 * P avec 13 = 1101 en binaire
-        - bit 1 : result = O, puis result = O + P = P
-        - bit 1 : result = 2P, puis result = 2P + P = 3P
-        - bit 0 : result = 6P (pas d'addition)
-        - bit 1 : result = 12P, puis result = 12P + P = 13P
-    
+           - Si d ≠ 0 : result = result + (d * P)  (lu dans la table)
+        5. Retourner result
+
+    Pour un scalaire de 160 bits, on passe ainsi de ~80 additions
+    (double-and-add binaire) à ~32, pour toujours ~160 doublements.
+
+    La boucle interne travaille en coordonnées jacobiennes (voir
+    _jac_double / _jac_add_affine) : aucune inversion modulaire par
+    étape, une seule inversion finale pour revenir en affine.
+
     Args:
         k: Le scalaire (entier positif)
-        P: Le point à multiplier
-    
+        P1: Le point à multiplier
+        cache: False pour un point éphémère : aucune table de
+            multiples n'est alors construite ni mémorisée (cf.
+            _wnaf_table), le calcul se fait en NAF simple avec ±P1
+
     Returns:
         Le point k * P
-    
+
     Exemple:
         >>> G = Point(GX, GY)
         >>> point_multiply(1, G) == G
@@ -312,23 +732,165 @@ def point_multiply(k: int, P: Point) -> Point:
     """
     if k == 0:
         return Point()  # 0 * P = O
-    
+
     if k < 0:
-        # k négatif : calculer |k| * P puis inverser
+        # k négatif : calculer |k| * (-P)
         k = -k
-        P = Point(P.x, (-P.y) % P)
-    
-    result = Point()  # Point à l'infini (élément neutre)
-    addend = Point(P.x, P.y)  # Copie de P
-    
-    # Algorithme double-and-add (parcours des bits de droite à gauche)
-    while k > 0:
-        if k & 1:  # Si le bit de poids faible est 1
-            result = point_add(result, addend)
-        addend = point_add(addend, addend)  # Doublement
-        k >>= 1  # Décalage à droite (division par 2)
-    
-    return result
+        P1 = point_negate(P1)
+
+    if P1.is_infinity():
+        return Point()
+
+    if cache:
+        # Multiples impairs ±1P, ±3P, ±5P, ±7P en affine, mémorisés par
+        # point de base (cf. _wnaf_table) : les vérifications répétées
+        # avec la même clé publique réutilisent la table sans recalcul
+        table = _wnaf_table(P1, cache)
+        digits = _naf(k, 4)
+    else:
+        # Point éphémère : construire la table (4 additions affines,
+        # donc 4 inversions modulaires) coûterait plus cher qu'elle
+        # n'économise sur un usage unique. NAF simple avec ±P1
+        # seulement : quelques additions mixtes de plus dans la
+        # boucle, aucun précalcul.
+        table = {
+            1: (_mpz(P1.x), _mpz(P1.y)),
+            -1: (_mpz(P1.x), _mpz((-P1.y) % P)),
+        }
+        digits = _naf(k, 2)
+
+    # Le chiffre de tête d'une forme NAF est toujours non nul :
+    # l'accumulateur démarre directement sur le point correspondant
+    X, Y = table[digits[-1]]
+    Z = _mpz(1)
+
+    # Parcours des chiffres restants, du plus significatif au moins
+    # significatif. Le doublement (~160 par scalaire) est inliné —
+    # même formule que _jac_double (a = -3) — pour économiser un appel
+    # de fonction Python par chiffre ; l'addition (~32 par scalaire)
+    # reste un appel à _jac_add_affine.
+    for d in reversed(digits[:-1]):
+        delta = Z * Z % P
+        gamma = Y * Y % P
+        beta = X * gamma % P
+        alpha = 3 * (X - delta) * (X + delta) % P
+        X3 = (alpha * alpha - 8 * beta) % P
+        Z = ((Y + Z) * (Y + Z) - gamma - delta) % P
+        Y = (alpha * (4 * beta - X3) - 8 * gamma * gamma) % P
+        X = X3
+        if d:
+            X, Y, Z = _jac_add_affine(X, Y, Z, *table[d])
+
+    # Retour en affine : l'unique inversion de toute la multiplication
+    return _jac_to_affine(X, Y, Z)
+
+
+def point_multiply2(k1: int, P1: Point, k2: int, P2: Point) -> Point:
+    """
+    Double multiplication scalaire simultanée : k1 * P1 + k2 * P2.
+
+    C'est exactement le calcul de la vérification ECDSA
+    (u1·G + u2·Q). Plutôt que deux multiplications indépendantes
+    (~320 doublements au total), l'astuce de Shamir parcourt les bits
+    de k1 et k2 EN MÊME TEMPS : un seul doublement par bit, puis une
+    addition choisie dans la table {O, P2, P1, P1+P2} selon la paire
+    de bits courante. On divise ainsi les doublements par deux
+    (~1,7 à 2 fois plus rapide qu'un calcul séparé).
+
+    Args:
+        k1: Premier scalaire (entier positif)
+        P1: Premier point
+        k2: Second scalaire (entier positif)
+        P2: Second point
+
+    Returns:
+        Le point k1 * P1 + k2 * P2
+
+    Exemple:
+        >>> point_multiply2(2, G, 3, G) == point_multiply(5, G)
+        True
+    """
+    if k1 < 0 or k2 < 0:
+        raise ValueError("point_multiply2 attend des scalaires positifs")
+
+    # Table indexée par la paire de bits (bit_k1 << 1) | bit_k2.
+    # Une entrée None signifie "point à l'infini" : rien à ajouter.
+    sum12 = point_add(P1, P2)
+    table = [
+        None,
+        None if P2.is_infinity() else (_mpz(P2.x), _mpz(P2.y)),
+        None if P1.is_infinity() else (_mpz(P1.x), _mpz(P1.y)),
+        None if sum12.is_infinity() else (_mpz(sum12.x), _mpz(sum12.y)),
+    ]
+
+    # Accumulateur en coordonnées jacobiennes (Z = 0 : point à l'infini)
+    X, Y, Z = _mpz(1), _mpz(1), _mpz(0)
+
+    # Parcours simultané des bits, du plus significatif au moins
+    # significatif
+    for i in range(max(k1.bit_length(), k2.bit_length()) - 1, -1, -1):
+        X, Y, Z = _jac_double(X, Y, Z)
+        entry = table[(((k1 >> i) & 1) << 1) | ((k2 >> i) & 1)]
+        if entry is not None:
+            X, Y, Z = _jac_add_affine(X, Y, Z, *entry)
+
+    return _jac_to_affine(X, Y, Z)
+
+
+def point_multiply_ct(k: int, P1: Point) -> Point:
+    """
+    Multiplication scalaire en temps (quasi) constant : k * P1.
+
+    ATTENTION SIDE-CHANNEL : les algorithmes rapides (NAF fenêtré,
+    table à base fixe) n'additionnent un point QUE lorsque le chiffre
+    courant du scalaire est non nul. Le temps d'exécution dépend donc
+    du motif de bits de k — et si k est un secret (clé privée, nonce
+    de signature), ce motif fuit par chronométrage. C'est exactement
+    ce genre de fuite qui trahit les implémentations ECDSA réelles.
+
+    L'échelle de Montgomery supprime la dépendance : UN doublement et
+    UNE addition à chaque bit, quel que soit le bit, sur un nombre
+    d'itérations fixe (la taille de N). Les deux registres R0 et R1
+    maintiennent l'invariant R1 = R0 + P1 :
+
+        bit = 0 :  R1 = R0 + R1 ;  R0 = 2·R0
+        bit = 1 :  R0 = R0 + R1 ;  R1 = 2·R1
+
+    (Python ne garantit pas un vrai temps constant au niveau des
+    entiers, mais la structure des opérations, elle, ne dépend plus
+    du scalaire.)
+
+    À utiliser pour les scalaires SECRETS (génération de clés,
+    signature) ; pour les scalaires publics (vérification), les
+    variantes rapides point_multiply / point_multiply2 restent
+    préférables.
+
+    Args:
+        k: Le scalaire secret (entier dans [1, N-1])
+        P1: Le point à multiplier
+
+    Returns:
+        Le point k * P1
+
+    Exemple:
+        >>> point_multiply_ct(7, G) == point_multiply(7, G)
+        True
+    """
+    k %= N
+    if k == 0 or P1.is_infinity():
+        return Point()
+
+    # R[0] = O, R[1] = P1, en coordonnées jacobiennes
+    R = [(_mpz(1), _mpz(1), _mpz(0)), (_mpz(P1.x), _mpz(P1.y), _mpz(1))]
+
+    # Nombre d'itérations FIXE : tous les scalaires prennent le même
+    # chemin, du bit 159 au bit 0
+    for i in range(N.bit_length() - 1, -1, -1):
+        b = (k >> i) & 1
+        R[1 - b] = _jac_add(*R[0], *R[1])
+        R[b] = _jac_double(*R[b])
+
+    return _jac_to_affine(*R[0])
 
 
 def point_negate(pt: Point) -> Point:
@@ -348,10 +910,76 @@ def point_negate(pt: Point) -> Point:
     """
     if pt.is_infinity():
         return Point()
-    
+
     return Point(pt.x, (-pt.y) % P)
 
 
+def match_signed_sum(target: Point, terms: list) -> bool:
+    """
+    Teste s'il existe des signes εᵢ = ±1 tels que Σ εᵢ·Tᵢ = target.
+
+    C'est la brique de la vérification par lots d'ECDSA : une
+    signature ne stocke que l'abscisse de son point Rᵢ, le signe de
+    l'ordonnée est perdu. L'équation de lot doit donc être testée pour
+    TOUTES les combinaisons de signes des termes aᵢ·Rᵢ.
+
+    Plutôt que de recalculer la somme à chaque combinaison, on part de
+    D = target − Σ Tᵢ (tous les signes à +) puis on parcourt les 2^n
+    combinaisons en code de Gray : deux combinaisons consécutives ne
+    diffèrent que d'un signe, donc D se met à jour avec le correctif
+    précalculé ±2·Tᵢ — UNE addition mixte en coordonnées jacobiennes
+    par combinaison testée, sans aucune inversion modulaire.
+
+    À réserver aux petits n (coût en 2^n).
+
+    Args:
+        target: Le point cible
+        terms: Les points Tᵢ (liste de Point)
+
+    Returns:
+        True si une combinaison de signes atteint target
+    """
+    # Un terme à l'infini est insensible au signe : on l'ignore
+    terms = [t for t in terms if not t.is_infinity()]
+
+    # D = target − Σ Tᵢ, en jacobien (Z = 0 : point à l'infini)
+    if target.is_infinity():
+        X, Y, Z = _mpz(1), _mpz(1), _mpz(0)
+    else:
+        X, Y, Z = _mpz(target.x), _mpz(target.y), _mpz(1)
+    for t in terms:
+        X, Y, Z = _jac_add_affine(X, Y, Z, t.x, (-t.y) % P)
+    if Z == 0:
+        return True
+
+    # Correctifs ±2·Tᵢ en affine (None si 2·Tᵢ = O : le signe de Tᵢ
+    # ne change alors rien à la somme)
+    plus2 = []
+    minus2 = []
+    for t in terms:
+        d2 = point_add(t, t)
+        if d2.is_infinity():
+            plus2.append(None)
+            minus2.append(None)
+        else:
+            plus2.append((d2.x, d2.y))
+            minus2.append((d2.x, (-d2.y) % P))
+
+    flipped = [False] * len(terms)
+
+    for g in range(1, 1 << len(terms)):
+        i = (g & -g).bit_length() - 1  # indice du signe à basculer
+        corr = plus2[i] if not flipped[i] else minus2[i]
+        flipped[i] = not flipped[i]
+        if corr is None:
+            continue
+        X, Y, Z = _jac_add_affine(X, Y, Z, *corr)
+        if Z == 0:
+            return True
+
+    return False
+
+
 # ============================================================================
 # POINT GÉNÉRATEUR
 # ============================================================================
@@ -360,6 +988,88 @@ def point_negate(pt: Point) -> Point:
 G = Point(GX, GY)
 
 
+# ----------------------------------------------------------------------------
+# Multiplication à base fixe : k * G
+# ----------------------------------------------------------------------------
+#
+# La génération de clés et la signature multiplient toujours le MÊME
+# point G. On peut donc précalculer une fois pour toutes, au chargement
+# du module, la table :
+#
+#     _BASE_TABLE[i][j] = j * 2^(4i) * G      (i = 0..39, j = 1..15)
+#
+# Un scalaire de 160 bits s'écrit en 40 chiffres de 4 bits ; chaque
+# chiffre non nul se lit directement dans la table. La multiplication
+# k * G ne coûte alors plus que ~40 additions mixtes et AUCUN
+# doublement, contre ~160 doublements + ~32 additions pour la
+# multiplication à base variable.
+
+def _build_base_table() -> list:
+    """
+    Construit la table des multiples de G pour point_multiply_base.
+
+    Returns:
+        Liste de 40 lignes ; la ligne i contient les points affines
+        j * 2^(4i) * G pour j de 1 à 15 (index 0 inutilisé : None)
+    """
+    table = []
+    base = G  # 2^(4i) * G pour la ligne courante
+
+    for _ in range(40):
+        # Coordonnées stockées en _mpz : accélère les additions mixtes
+        # de point_multiply_base quand gmpy2 est disponible
+        row = [None, (_mpz(base.x), _mpz(base.y))]
+        multiple = base
+        for _ in range(2, 16):
+            multiple = point_add(multiple, base)
+            row.append((_mpz(multiple.x), _mpz(multiple.y)))
+        table.append(row)
+
+        # Base suivante : 16 * base (4 doublements)
+        for _ in range(4):
+            base = point_add(base, base)
+
+    return table
+
+
+_BASE_TABLE = _build_base_table()
+
+
+def point_multiply_base(k: int) -> Point:
+    """
+    Multiplication scalaire à base fixe : calcule k * G.
+
+    Découpe k en chiffres de 4 bits et additionne les points
+    correspondants lus dans _BASE_TABLE (voir ci-dessus). Environ
+    5 à 10 fois plus rapide que point_multiply(k, G).
+
+    Args:
+        k: Le scalaire (entier positif)
+
+    Returns:
+        Le point k * G
+
+    Exemple:
+        >>> point_multiply_base(1) == G
+        True
+        >>> point_multiply_base(N).is_infinity()
+        True
+    """
+    k %= N
+    if k == 0:
+        return Point()
+
+    # Accumulateur en coordonnées jacobiennes (Z = 0 : point à l'infini)
+    X, Y, Z = _mpz(1), _mpz(1), _mpz(0)
+
+    for i in range(40):
+        digit = (k >> (4 * i)) & 0xF
+        if digit:
+            X, Y, Z = _jac_add_affine(X, Y, Z, *_BASE_TABLE[i][digit])
+
+    return _jac_to_affine(X, Y, Z)
+
+
 # ============================================================================
 # FONCTIONS UTILITAIRES
 # ============================================================================